@@ -69,21 +69,22 @@ class Pipeline:
             return body
 
         # 2. Format the context
-        context_str = "\n[Wheeler Memory - Episodic Context]\n"
+        parts = ["\n[Wheeler Memory - Episodic Context]\n"]
         for r in results:
-            if r['effective_similarity'] < self.min_similarity:
-                continue
-            
             # Use reconstructed attractor's similarity if available, else standard
             sim = r.get('effective_similarity', 0.0)
+            if sim < self.min_similarity:
+                continue
+
             text = r['text']
             tier = r['temperature_tier'].upper()
             temp = r['temperature']
-            
+
             # Format: [TIER temp] "text" (similarity)
-            context_str += f"[{tier} {temp:.2f}] \"{text}\" (sim={sim:.2f})\n"
+            parts.append(f"[{tier} {temp:.2f}] \"{text}\" (sim={sim:.2f})\n")
 
-        context_str += "Use this context to inform your response. Cold memories are uncertain.\n"
+        parts.append("Use this context to inform your response. Cold memories are uncertain.\n")
+        context_str = "".join(parts)
 
         # 3. Inject into system prompt
         # We find the system message in 'messages' or prepend a new one
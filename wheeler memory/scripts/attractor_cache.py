@@ -0,0 +1,148 @@
+"""Feather (Arrow IPC) cache of evolved attractors, keyed by text hash.
+
+Shared by the bulk CLI scripts (wheeler-diversity-math, test_paraphrase)
+so repeat runs over the same texts skip CA evolution. The file is written
+uncompressed, so loads are a memory map rather than a parse. Requires
+pyarrow, imported lazily.
+
+Every file carries a fingerprint of what produced it (format, backend,
+max_iters and a hash of the CA source). A file whose fingerprint does not
+match the current code is ignored and rebuilt, so a change to the
+dynamics can never be masked by stale attractors.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+import wheeler_memory
+from wheeler_memory.hashing import text_to_hex
+
+FRAME_CELLS = 64 * 64
+CACHE_FORMAT = 1
+
+# Sources whose contents determine an evolution result, per backend
+_PACKAGE_DIR = Path(wheeler_memory.__file__).parent
+_CPU_SOURCES = ("hashing.py", "dynamics.py", "oscillation.py")
+_GPU_SOURCES = _CPU_SOURCES + ("gpu_dynamics.py", "gpu/ca_kernel.hip")
+
+
+def _pyarrow():
+    """Import pyarrow on first use (optional dependency)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise RuntimeError("Attractor cache requires pyarrow: pip install pyarrow") from e
+    return pa, feather
+
+
+def dynamics_fingerprint(backend: str, max_iters: int) -> dict[str, str]:
+    """Describe the code that evolves attractors, for the file's metadata."""
+    digest = hashlib.sha256()
+    for name in _GPU_SOURCES if backend == "gpu" else _CPU_SOURCES:
+        path = _PACKAGE_DIR / name
+        digest.update(name.encode())
+        digest.update(path.read_bytes() if path.exists() else b"<missing>")
+    return {
+        "format": str(CACHE_FORMAT),
+        "backend": backend,
+        "max_iters": str(max_iters),
+        "dynamics_sha256": digest.hexdigest(),
+    }
+
+
+class AttractorCache:
+    """Text -> (state, ticks, attractor) store backed by a Feather file.
+
+    Rows are keyed by SHA-256 of the text (same key as bricks), and hold
+    the evolution result for the given backend ("cpu" or "gpu") and
+    max_iters. Loaded rows are read-only views into the memory-mapped
+    file; new rows are buffered until save(). A file written by different
+    code or settings is ignored, and save() replaces it.
+    """
+
+    def __init__(self, path, backend: str, max_iters: int = 1000):
+        self.path = Path(path)
+        self._pa, self._feather = _pyarrow()
+        self.fingerprint = dynamics_fingerprint(backend, max_iters)
+        self._index = {}
+        self._states = []
+        self._ticks = np.zeros(0, dtype=np.int32)
+        self._attractors = np.zeros((0, 64, 64), dtype=np.float32)
+        self._new = []  # (key, state, ticks, attractor) added since load
+        self._new_keys = set()
+
+        if self.path.exists():
+            tbl = self._feather.read_table(self.path, memory_map=True)
+            stored = {
+                k.decode(): v.decode() for k, v in (tbl.schema.metadata or {}).items()
+            }
+            if stored != self.fingerprint:
+                print(
+                    f"  Ignoring attractor cache {self.path}: built by different "
+                    f"CA code or settings; it will be rebuilt"
+                )
+                return
+            self._index = {h: i for i, h in enumerate(tbl.column("h").to_pylist())}
+            self._states = tbl.column("state").to_pylist()
+            self._ticks = tbl.column("ticks").to_numpy()
+            flat = tbl.column("attractor").combine_chunks().flatten().to_numpy()
+            self._attractors = flat.reshape(-1, 64, 64)
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._new)
+
+    def fill(self, texts, attractors, states, ticks) -> list[int]:
+        """Copy cached results for texts into the caller's arrays.
+
+        attractors is an (N, 64, 64) array; states and ticks are length-N
+        lists. Returns the indices of texts that are not cached.
+        """
+        pending = []
+        for i, text in enumerate(texts):
+            row = self._index.get(text_to_hex(text))
+            if row is None:
+                pending.append(i)
+                continue
+            attractors[i] = self._attractors[row]
+            states[i] = self._states[row]
+            ticks[i] = int(self._ticks[row])
+        return pending
+
+    def add(self, texts, attractors, states, ticks):
+        """Record freshly evolved results (aligned sequences) for save()."""
+        for text, att, state, tick in zip(texts, attractors, states, ticks):
+            key = text_to_hex(text)
+            if key in self._index or key in self._new_keys:
+                continue
+            self._new_keys.add(key)
+            self._new.append((key, state, int(tick), att))
+
+    def save(self):
+        """Write loaded plus new rows back to the Feather file."""
+        if not self._new:
+            return
+        pa = self._pa
+        keys = list(self._index) + [h for h, _, _, _ in self._new]
+        states = self._states + [s for _, s, _, _ in self._new]
+        ticks = np.concatenate([self._ticks, [t for _, _, t, _ in self._new]]).astype(np.int32)
+        attractors = np.concatenate(
+            [self._attractors, np.stack([a for _, _, _, a in self._new]).astype(np.float32)]
+        )
+
+        table = pa.table({
+            "h": pa.array(keys, type=pa.string()),
+            "state": pa.array(states, type=pa.string()),
+            "ticks": pa.array(ticks, type=pa.int32()),
+            "attractor": pa.FixedSizeListArray.from_arrays(
+                pa.array(attractors.reshape(-1)), FRAME_CELLS
+            ),
+        })
+        table = table.replace_schema_metadata(self.fingerprint)
+        # Write beside the old file and swap in, since it may still be mapped
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        self._feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, self.path)
@@ -8,11 +8,10 @@ import time
 import numpy as np
 
 from wheeler_memory import (
-    evolve_and_interpret,
+    evolve_and_interpret_batch,
     hash_to_frame,
     gpu_available,
-    gpu_evolve_batch,
-    gpu_evolve_single,
+    gpu_evolve_batch_arrays,
 )
 
 
@@ -27,28 +26,26 @@ def verify_correctness(n=100):
         return False
 
     texts = [f"correctness test input {i} with unique content {i**2}" for i in range(n)]
-    frames = [hash_to_frame(t) for t in texts]
+    frames = np.stack([hash_to_frame(t) for t in texts])
 
-    mismatches = 0
-    tick_errors = 0
+    # One batched call per backend, then compare all attractors at once
+    cpu_results = evolve_and_interpret_batch(frames)
+    gpu_atts, _, gpu_ticks = gpu_evolve_batch_arrays(frames)
 
-    for i, frame in enumerate(frames):
-        cpu_result = evolve_and_interpret(frame.copy())
-        gpu_result = gpu_evolve_single(frame.copy())
+    cpu_atts = np.stack([r["attractor"] for r in cpu_results])
+    cpu_ticks = np.array([r["convergence_ticks"] for r in cpu_results])
 
-        cpu_att = cpu_result["attractor"]
-        gpu_att = gpu_result["attractor"]
+    att_ok = np.isclose(cpu_atts, gpu_atts, atol=1e-4).reshape(n, -1).all(axis=1)
+    max_diffs = np.abs(cpu_atts - gpu_atts).reshape(n, -1).max(axis=1)
+    att_bad = np.flatnonzero(~att_ok)
+    tick_bad = np.flatnonzero(cpu_ticks != gpu_ticks)
+    mismatches = len(att_bad)
+    tick_errors = len(tick_bad)
 
-        if not np.allclose(cpu_att, gpu_att, atol=1e-4):
-            max_diff = np.max(np.abs(cpu_att - gpu_att))
-            mismatches += 1
-            if mismatches <= 3:
-                print(f"  MISMATCH #{i}: max_diff={max_diff:.6f}")
-
-        if cpu_result["convergence_ticks"] != gpu_result["convergence_ticks"]:
-            tick_errors += 1
-            if tick_errors <= 3:
-                print(f"  TICK MISMATCH #{i}: CPU={cpu_result['convergence_ticks']} GPU={gpu_result['convergence_ticks']}")
+    for i in att_bad[:3]:
+        print(f"  MISMATCH #{i}: max_diff={max_diffs[i]:.6f}")
+    for i in tick_bad[:3]:
+        print(f"  TICK MISMATCH #{i}: CPU={cpu_ticks[i]} GPU={gpu_ticks[i]}")
 
     if mismatches == 0 and tick_errors == 0:
         print(f"  ✓ All {n} inputs match exactly (atol=1e-4)")
@@ -69,20 +66,22 @@ def benchmark(batch_sizes=None):
     print(f"  {'Batch':>6}  {'CPU (s)':>9}  {'GPU (s)':>9}  {'Speedup':>8}  {'GPU samp/s':>10}")
     print(f"  {'─'*6}  {'─'*9}  {'─'*9}  {'─'*8}  {'─'*10}")
 
+    # Hash once for the largest batch; smaller rows time a prefix slice
+    max_n = max(batch_sizes)
+    all_frames = np.stack([hash_to_frame(f"benchmark input {i}") for i in range(max_n)])
+
     for n in batch_sizes:
-        texts = [f"benchmark input {i} batch {n}" for i in range(n)]
-        frames = [hash_to_frame(t) for t in texts]
+        frames = all_frames[:n]
 
-        # CPU timing
-        cpu_start = time.time()
-        for f in frames:
-            evolve_and_interpret(f.copy())
-        cpu_time = time.time() - cpu_start
+        # CPU timing (lockstep batch)
+        cpu_start = time.perf_counter_ns()
+        evolve_and_interpret_batch(frames)
+        cpu_time = (time.perf_counter_ns() - cpu_start) / 1e9
 
         # GPU timing (batch)
-        gpu_start = time.time()
-        gpu_evolve_batch([f.copy() for f in frames])
-        gpu_time = time.time() - gpu_start
+        gpu_start = time.perf_counter_ns()
+        gpu_evolve_batch_arrays(frames)
+        gpu_time = (time.perf_counter_ns() - gpu_start) / 1e9
 
         speedup = cpu_time / gpu_time if gpu_time > 0 else float('inf')
         gpu_rate = n / gpu_time if gpu_time > 0 else float('inf')
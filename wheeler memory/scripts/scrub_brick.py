@@ -9,9 +9,6 @@ Usage:
 import argparse
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider
-
 from wheeler_memory.brick import MemoryBrick
 from wheeler_memory.chunking import find_brick_across_chunks, get_chunk_dir
 from wheeler_memory.hashing import text_to_hex
@@ -53,6 +50,10 @@ def main():
     brick = MemoryBrick.load(brick_path)
     n_ticks = len(brick.evolution_history)
 
+    # Imported only once a brick is found so --help and lookup misses stay fast
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Slider
+
     fig, ax = plt.subplots(figsize=(8, 8))
     plt.subplots_adjust(bottom=0.15)
 
@@ -64,12 +65,38 @@ def main():
     slider_ax = plt.axes([0.15, 0.05, 0.7, 0.03])
     slider = Slider(slider_ax, "Tick", 0, n_ticks - 1, valinit=0, valstep=1)
 
+    # Blit only the frame, title and slider on each tick instead of
+    # re-rendering the whole figure (axes, colorbar, ticks).
+    use_blit = fig.canvas.supports_blit
+    background = None
+    if use_blit:
+        slider.drawon = False
+        im.set_animated(True)
+        ax.title.set_animated(True)
+
+    def draw_animated():
+        ax.draw_artist(im)
+        ax.draw_artist(ax.title)
+        fig.draw_artist(slider_ax)
+
+    def on_draw(event):
+        nonlocal background
+        background = fig.canvas.copy_from_bbox(fig.bbox)
+        draw_animated()
+
     def update(val):
         tick = int(slider.val)
         im.set_data(brick.evolution_history[tick])
         ax.set_title(f"Tick {tick} / {n_ticks - 1}  |  State: {brick.state}")
-        fig.canvas.draw_idle()
+        if background is None:
+            fig.canvas.draw_idle()
+            return
+        fig.canvas.restore_region(background)
+        draw_animated()
+        fig.canvas.blit(fig.bbox)
 
+    if use_blit:
+        fig.canvas.mpl_connect("draw_event", on_draw)
     slider.on_changed(update)
     plt.show()
 
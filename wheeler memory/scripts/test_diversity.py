@@ -8,13 +8,12 @@ Saves a visual report to diversity_report.png.
 
 import argparse
 import time
+from collections import Counter
 
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
-from scipy.stats import pearsonr
 
 from wheeler_memory import evolve_and_interpret, get_cell_roles, hash_to_frame
+from wheeler_memory import gpu_available, gpu_evolve_batch
 
 TEST_INPUTS = [
     "Fix authentication bug in login flow",
@@ -62,38 +61,53 @@ def make_edge_cases():
 
     return cases
 
-# Discrete 3-color map for cell roles: min=-1 (blue), slope=0 (gray), max=+1 (red)
-ROLE_CMAP = mcolors.ListedColormap(["#3B82F6", "#9CA3AF", "#EF4444"])
-ROLE_NORM = mcolors.BoundaryNorm([-1.5, -0.5, 0.5, 1.5], ROLE_CMAP.N)
-
 
 def main():
     parser = argparse.ArgumentParser(description="Wheeler Memory attractor diversity test")
     parser.add_argument("--output", default="diversity_report.png", help="Output image path")
+    parser.add_argument("--gpu", action="store_true", help="Use GPU batch evolution (requires libwheeler_ca.so)")
+    parser.add_argument("--dpi", type=int, default=100, help="Report image resolution")
+    parser.add_argument("--no-plot", action="store_true", help="Skip the visual report (stats only)")
     args = parser.parse_args()
 
+    use_gpu = args.gpu and gpu_available()
+    if args.gpu and not gpu_available():
+        print("Warning: --gpu requested but GPU not available, falling back to CPU")
+
     n = len(TEST_INPUTS)
-    attractors = []
+    attractors = np.empty((n, 64, 64), dtype=np.float32)
     states = []
     ticks_list = []
     all_results = []  # (text, result) for all inputs including edge cases
 
-    print(f"Evolving {n} test inputs...")
-    total_start = time.time()
+    backend = "GPU" if use_gpu else "CPU"
+    print(f"Evolving {n} test inputs ({backend})...")
+    total_start = time.perf_counter_ns()
 
-    for i, text in enumerate(TEST_INPUTS):
-        frame = hash_to_frame(text)
-        start = time.time()
-        result = evolve_and_interpret(frame)
-        elapsed = time.time() - start
+    if use_gpu:
+        # One batched launch instead of n sequential evolutions
+        frames = np.stack([hash_to_frame(t) for t in TEST_INPUTS])
+        start = time.perf_counter_ns()
+        batch_results = gpu_evolve_batch(frames)
+        print(f"  GPU batch done in {(time.perf_counter_ns() - start) / 1e9:.3f}s")
 
-        attractors.append(result["attractor"].flatten())
+    for i, text in enumerate(TEST_INPUTS):
+        if use_gpu:
+            result = batch_results[i]
+            timing = ""
+        else:
+            frame = hash_to_frame(text)
+            start = time.perf_counter_ns()
+            result = evolve_and_interpret(frame)
+            timing = f"  {(time.perf_counter_ns() - start) / 1e9:.3f}s"
+
+        attractors[i] = result["attractor"]
         states.append(result["state"])
         ticks_list.append(result["convergence_ticks"])
         all_results.append((text, result))
 
         label = text[:50]
-        print(f"  [{i + 1:2d}/{n}] {result['state']:<11} {result['convergence_ticks']:>4} ticks  {elapsed:.3f}s  {label}")
+        print(f"  [{i + 1:2d}/{n}] {result['state']:<11} {result['convergence_ticks']:>4} ticks{timing}  {label}")
 
     # Run edge-case inputs with synthetic frames
     edge_cases = make_edge_cases()
@@ -101,9 +115,9 @@ def main():
     edge_results = []
     for ec in edge_cases:
         frame = ec["frame"]
-        start = time.time()
+        start = time.perf_counter_ns()
         result = evolve_and_interpret(frame, max_iters=ec["max_iters"])
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
         edge_results.append((ec, result))
         all_results.append((ec["label"], result))
 
@@ -113,18 +127,16 @@ def main():
         match = "✓" if actual == expected else "✗"
         print(f"  {match} {actual:<11} {result['convergence_ticks']:>4} ticks  {elapsed:.3f}s  {label}")
 
-    total_time = time.time() - total_start
+    total_time = (time.perf_counter_ns() - total_start) / 1e9
 
-    # Compute correlation matrix (converged attractors only)
-    corr_matrix = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                corr_matrix[i, j] = 1.0
-            elif j > i:
-                c, _ = pearsonr(attractors[i], attractors[j])
-                corr_matrix[i, j] = c
-                corr_matrix[j, i] = c
+    # Compute correlation matrix (converged attractors only): centre and
+    # L2-normalise each row so a single matmul yields every Pearson r at once
+    A = attractors.reshape(n, -1)
+    A = A - A.mean(axis=1, keepdims=True)  # new buffer; attractors stay intact for plotting
+    norms = np.linalg.norm(A, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0  # avoid div-by-zero
+    A /= norms
+    corr_matrix = (A @ A.T).astype(np.float64)
 
     # Statistics
     off_diag = corr_matrix[np.triu_indices(n, k=1)]
@@ -133,11 +145,11 @@ def main():
     min_corr = float(np.min(np.abs(off_diag)))
 
     # State counts across all inputs
-    all_states = [r["state"] for _, r in all_results]
-    n_total = len(all_states)
-    n_converged = all_states.count("CONVERGED")
-    n_oscillating = all_states.count("OSCILLATING")
-    n_chaotic = all_states.count("CHAOTIC")
+    counts = Counter(r["state"] for _, r in all_results)
+    n_total = len(all_results)
+    n_converged = counts["CONVERGED"]
+    n_oscillating = counts["OSCILLATING"]
+    n_chaotic = counts["CHAOTIC"]
 
     print(f"\n{'=' * 60}")
     print(f"DIVERSITY REPORT")
@@ -157,7 +169,23 @@ def main():
     print(f"Max < 0.85: {'PASS' if pass_max else 'FAIL'} ({max_corr:.4f})")
     print(f"Overall:    {'PASS' if (pass_avg and pass_max) else 'FAIL'}")
 
+    if args.no_plot:
+        return
+
     # Generate visual report
+    # Imported here so --help and --no-plot runs skip matplotlib's startup cost
+    import matplotlib
+
+    matplotlib.use("Agg")  # reports are only saved to file; skip GUI backends
+
+    import matplotlib.colors as mcolors
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Patch
+
+    # Discrete 3-color map for cell roles: min=-1 (blue), slope=0 (gray), max=+1 (red)
+    role_cmap = mcolors.ListedColormap(["#3B82F6", "#9CA3AF", "#EF4444"])
+    role_norm = mcolors.BoundaryNorm([-1.5, -0.5, 0.5, 1.5], role_cmap.N)
+
     fig = plt.figure(figsize=(16, 14))
 
     # --- Top row: correlation matrix + histogram ---
@@ -178,12 +206,17 @@ def main():
     ax2.set_ylabel("Count")
     ax2.legend()
 
+    # Classify every displayed attractor in one batched call: the first 4
+    # converged inputs, then the edge-case snapshots
+    shown = [attractors[idx] for idx in range(4)]
+    shown += [result["attractor"] for _, result in edge_results[:1]]
+    shown_roles = get_cell_roles(np.stack(shown))
+
     # --- Middle row: 4 converged attractors shown as cell roles (tri-color) ---
     for idx in range(4):
         ax = fig.add_subplot(3, 4, 5 + idx)
-        att = attractors[idx].reshape(64, 64)
-        roles = get_cell_roles(att)
-        ax.imshow(roles, cmap=ROLE_CMAP, norm=ROLE_NORM, interpolation="nearest")
+        roles = shown_roles[idx]
+        ax.imshow(roles, cmap=role_cmap, norm=role_norm, interpolation="nearest")
         label = TEST_INPUTS[idx][:25]
         ax.set_title(f"#{idx}: {label}...", fontsize=8)
         ax.axis("off")
@@ -207,13 +240,12 @@ def main():
     if edge_results:
         # Show the first edge case attractor as roles
         ec, result = edge_results[0]
-        roles = get_cell_roles(result["attractor"])
-        ax_edge.imshow(roles, cmap=ROLE_CMAP, norm=ROLE_NORM, interpolation="nearest")
+        roles = shown_roles[4]
+        ax_edge.imshow(roles, cmap=role_cmap, norm=role_norm, interpolation="nearest")
         ax_edge.set_title(f"Edge: {result['state']} ({result['convergence_ticks']} ticks)", fontsize=9)
     ax_edge.axis("off")
 
     # Role legend
-    from matplotlib.patches import Patch
     legend_elements = [
         Patch(facecolor="#EF4444", edgecolor="black", label="Local Max (+1)"),
         Patch(facecolor="#9CA3AF", edgecolor="black", label="Slope (0)"),
@@ -231,7 +263,8 @@ def main():
         fontweight="bold",
     )
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.savefig(args.output, dpi=150)
+    plt.savefig(args.output, dpi=args.dpi)
+    plt.close(fig)
     print(f"\nSaved visual report to {args.output}")
 
 
@@ -7,79 +7,135 @@ Wheeler CA, and generates a diversity report with vectorised correlation.
 
 import argparse
 import json
+import random
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
+from scipy.linalg.blas import ssyrk
 
 from wheeler_memory import evolve_and_interpret, get_cell_roles, hash_to_frame
-from wheeler_memory import gpu_available, gpu_evolve_batch
+from wheeler_memory import gpu_available, gpu_evolve_batch_arrays
 
-# Discrete 3-color map for cell roles
-ROLE_CMAP = mcolors.ListedColormap(["#3B82F6", "#9CA3AF", "#EF4444"])
-ROLE_NORM = mcolors.BoundaryNorm([-1.5, -0.5, 0.5, 1.5], ROLE_CMAP.N)
+from scripts.attractor_cache import AttractorCache
 
 HF_API = "https://datasets-server.huggingface.co/rows"
 PAGE_SIZE = 100  # HF API max per request
 DATASET_NAME = "openbmb/UltraData-Math"
 DATASET_CONFIG = "UltraData-Math-L3-QA-Synthetic"
+FETCH_WORKERS = 8  # concurrent page requests
+FETCH_RATE = 5.0  # request starts per second, shared by all workers
+CORR_BLOCK = 2048  # rows per correlation tile
+ABS_BINS = 100_000  # |r| histogram bins on [0, 1] (percentile resolution)
+EXACT_PAIRS = 5_000_000  # up to this many pairs, percentiles use raw values
+SIGNED_BINS = 2000  # r histogram bins on [-1, 1] for the report plot
+DISPLAY_SIZE = 200  # max side of the displayed correlation matrix
 
 
-def fetch_math_samples(n=10000, offset=0):
-    """Fetch n samples via paginated HF Datasets Server API calls.
+class _RateLimiter:
+    """Token bucket shared across fetch threads.
 
-    Includes exponential backoff on HTTP 429 (rate limit) and a small
-    inter-request delay to stay under HuggingFace rate limits.
+    Spaces request starts at least 1/rate seconds apart, however many
+    workers are waiting, so concurrency overlaps latency without raising
+    the request rate HuggingFace sees.
     """
-    samples = []
-    pages = (n + PAGE_SIZE - 1) // PAGE_SIZE
-    print(f"Fetching {n} samples ({pages} pages) from L3-QA-Synthetic...")
-
-    for page in range(pages):
-        page_offset = offset + page * PAGE_SIZE
-        remaining = n - len(samples)
-        length = min(PAGE_SIZE, remaining)
-        url = (
-            f"{HF_API}?dataset=openbmb/UltraData-Math"
-            f"&config=UltraData-Math-L3-QA-Synthetic"
-            f"&split=train"
-            f"&offset={page_offset}"
-            f"&length={length}"
-        )
 
-        # Retry with exponential backoff on rate limit
-        max_retries = 4
-        for attempt in range(max_retries):
-            try:
-                req = urllib.request.Request(url)
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    data = json.loads(resp.read().decode())
-                for row_obj in data.get("rows", []):
-                    text = row_obj.get("row", {}).get("content", "")
-                    samples.append(text[:500])
-                break  # success
-            except urllib.error.HTTPError as e:
-                if e.code == 429 and attempt < max_retries - 1:
-                    wait = 2 ** (attempt + 1)  # 2, 4, 8, 16s
-                    print(f"  Rate limited, waiting {wait}s (attempt {attempt + 1})...")
-                    time.sleep(wait)
-                else:
-                    print(f"  Page {page + 1}/{pages} failed: {e}")
-                    break
-            except Exception as e:
-                print(f"  Page {page + 1}/{pages} failed: {e}")
+    def __init__(self, rate):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_fetch_limiter = _RateLimiter(FETCH_RATE)
+
+
+def _fetch_page(page_offset, length):
+    """Fetch one page of rows from the HF Datasets Server API.
+
+    Retries with jittered exponential backoff on HTTP 429 (rate limit).
+    Returns the page's texts truncated to 500 chars, or [] on failure.
+    """
+    url = (
+        f"{HF_API}?dataset=openbmb/UltraData-Math"
+        f"&config=UltraData-Math-L3-QA-Synthetic"
+        f"&split=train"
+        f"&offset={page_offset}"
+        f"&length={length}"
+    )
+
+    rows = []
+    max_retries = 4
+    for attempt in range(max_retries):
+        _fetch_limiter.acquire()
+        try:
+            req = urllib.request.Request(url)
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                data = json.loads(resp.read().decode())
+            rows = [
+                row_obj.get("row", {}).get("content", "")[:500]
+                for row_obj in data.get("rows", [])
+            ]
+            break  # success
+        except urllib.error.HTTPError as e:
+            if e.code == 429 and attempt < max_retries - 1:
+                wait = 2 ** (attempt + 1) + random.uniform(0, 1)  # ~2, 4, 8, 16s
+                print(f"  Rate limited at offset {page_offset}, waiting {wait:.1f}s (attempt {attempt + 1})...")
+                time.sleep(wait)
+            else:
+                print(f"  Page at offset {page_offset} failed: {e}")
                 break
+        except Exception as e:
+            print(f"  Page at offset {page_offset} failed: {e}")
+            break
+
+    return rows
+
 
-        # Small delay between requests to avoid triggering 429s
-        time.sleep(0.2)
+def fetch_math_samples(n=10000, offset=0, workers=FETCH_WORKERS):
+    """Fetch n samples via paginated HF Datasets Server API calls.
 
-        # Progress every 10 pages
-        if (page + 1) % 10 == 0 or page == pages - 1:
-            print(f"  [{page + 1}/{pages}] fetched {len(samples)} samples")
+    Pages are requested concurrently by a small thread pool (the fetch is
+    latency-bound) and collated in offset order. A shared token bucket
+    paces request starts, and each request backs off exponentially on
+    HTTP 429 to stay under HuggingFace rate limits.
+    """
+    pages = (n + PAGE_SIZE - 1) // PAGE_SIZE
+    print(f"Fetching {n} samples ({pages} pages, {workers} workers) from L3-QA-Synthetic...")
+
+    offsets = [offset + page * PAGE_SIZE for page in range(pages)]
+    lengths = [min(PAGE_SIZE, n - page * PAGE_SIZE) for page in range(pages)]
+
+    # Slot per page so completion order doesn't affect sample order
+    page_rows = [None] * pages
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_fetch_page, page_offset, length): page
+            for page, (page_offset, length) in enumerate(zip(offsets, lengths))
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            rows = future.result()
+            page_rows[futures[future]] = rows
+            fetched += len(rows)
+
+            # Progress every 10 pages
+            if done % 10 == 0 or done == pages:
+                print(f"  [{done}/{pages}] fetched {fetched} samples")
+
+    samples = [text for rows in page_rows for text in rows]
 
     print(f"  Total: {len(samples)} samples\n")
     return samples
@@ -102,28 +158,138 @@ def fetch_math_samples_local(n=10000, seed=42):
     indices = rng.choice(total, size=min(n, total), replace=False)
     indices.sort()  # sequential access is faster on Arrow
 
-    samples = []
-    for i, idx in enumerate(indices):
-        text = ds[int(idx)]["content"]
-        samples.append(text[:500])
-        if (i + 1) % 5000 == 0 or i == len(indices) - 1:
-            print(f"  [{i + 1:>6}/{n}] sampled")
+    # One Arrow gather of the single column we need, instead of building
+    # a full row dict per index
+    texts = ds.select(indices.tolist())["content"]
+    samples = [text[:500] for text in texts]
 
     print(f"  Total: {len(samples)} samples (random seed={seed})\n")
     return samples
 
 
-def vectorised_corrmatrix(attractors):
-    """Compute full NxN Pearson correlation matrix via numpy BLAS."""
-    X = np.array(attractors, dtype=np.float32)  # N x 4096
-    # Standardise each row
-    X -= X.mean(axis=1, keepdims=True)
+def _standardise(attractors):
+    """Return row z-scores of an (N, D) float32 array as a new array."""
+    # Centring allocates the working copy; the rest is done in place
+    X = attractors - attractors.mean(axis=1, keepdims=True)
     std = X.std(axis=1, keepdims=True)
     std[std == 0] = 1.0  # avoid div-by-zero
     X /= std
-    # Pearson r = dot(Xi, Xj) / D
-    corr = (X @ X.T) / X.shape[1]
-    return corr.astype(np.float64)
+    return X
+
+
+def _hist_percentile(counts, q):
+    """Percentile q (0-100) of |r| from its fixed-width histogram on [0, 1].
+
+    Mirrors numpy's linear method, interpolating within the bin, so the
+    result is exact to within 1/len(counts).
+    """
+    cum = np.cumsum(counts)
+    rank = q / 100 * (cum[-1] - 1)
+    b = int(np.searchsorted(cum, rank, side="right"))
+    before = cum[b - 1] if b else 0
+    frac = (rank - before + 0.5) / counts[b]
+    return (b + frac) / len(counts)
+
+
+def _cupy_available() -> bool:
+    """Check if cupy is importable and sees at least one GPU."""
+    try:
+        import cupy
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def tiled_corr_stats(attractors, block=CORR_BLOCK, gpu=False):
+    """Off-diagonal Pearson statistics without materialising the NxN matrix.
+
+    attractors is an (N, 4096) float32 array; it is left unmodified. Rows
+    are processed in blocks: the diagonal tile through a BLAS syrk (upper
+    triangle only) and the strip to its right through a gemm, so peak
+    memory is O(N*D + block*N) and each pair is computed once. Running
+    sum/min/max give exact mean and extremes; percentiles come from a
+    fine |r| histogram once there are more than EXACT_PAIRS pairs (exact
+    below that). A downsampled matrix is kept for display.
+
+    With gpu=True the tiles and running statistics stay on the device via
+    cupy (plain gemm tiles; cuBLAS has no syrk path in cupy) and only the
+    histograms come back. Set CUPY_TF32=1 to let cuBLAS use TF32 tensor
+    cores for the gemms.
+    """
+    X = _standardise(attractors)
+    n, d = X.shape
+    if gpu:
+        import cupy as xp
+        Xd = xp.asarray(X)
+    else:
+        xp, Xd = np, X
+    n_pairs = n * (n - 1) // 2
+    exact = [] if n_pairs <= EXACT_PAIRS else None
+
+    abs_counts = xp.zeros(ABS_BINS, dtype=np.int64)
+    signed_counts = xp.zeros(SIGNED_BINS, dtype=np.int64)
+    total = 0.0
+    lo, hi = np.inf, 0.0
+
+    def accumulate(r):
+        nonlocal total, lo, hi
+        a = xp.abs(r)
+        total += float(a.sum(dtype=np.float64))
+        lo = min(lo, float(a.min()))
+        hi = max(hi, float(a.max()))
+        if exact is not None:
+            exact.append(a)
+        idx = xp.minimum((a * ABS_BINS).astype(np.intp), ABS_BINS - 1)
+        abs_counts[:] += xp.bincount(idx, minlength=ABS_BINS)
+        idx = xp.clip(((r + 1) * (SIGNED_BINS / 2)).astype(np.intp), 0, SIGNED_BINS - 1)
+        signed_counts[:] += xp.bincount(idx, minlength=SIGNED_BINS)
+
+    for i0 in range(0, n, block):
+        Xb = Xd[i0:i0 + block]
+        b = len(Xb)
+        # Diagonal tile, strict upper triangle
+        if gpu:
+            tile = Xb @ Xb.T
+            tile *= 1.0 / d
+        else:
+            # X.T keeps BLAS copy-free
+            tile = ssyrk(alpha=1.0 / d, a=Xb.T, trans=1, lower=0)
+        if b > 1:
+            accumulate(tile[xp.triu_indices(b, k=1)])
+        # Every pair between this block and the later rows
+        if i0 + b < n:
+            strip = Xb @ Xd[i0 + b:].T
+            strip *= 1.0 / d
+            accumulate(strip.ravel())
+
+    if exact is not None:
+        a = xp.concatenate(exact)
+        median, p95, p99 = (float(v) for v in xp.percentile(a, [50, 95, 99]))
+    else:
+        if gpu:
+            abs_counts = abs_counts.get()
+        median, p95, p99 = (_hist_percentile(abs_counts, q) for q in (50, 95, 99))
+    if gpu:
+        signed_counts = signed_counts.get()
+
+    # Display copy: every step-th sample against itself
+    step = max(1, n // DISPLAY_SIZE)
+    Xs = X[::step]
+    display = (Xs @ Xs.T) / d
+
+    return {
+        "n_pairs": n_pairs,
+        "avg": total / n_pairs,
+        "min": lo,
+        "max": hi,
+        "median": median,
+        "p95": p95,
+        "p99": p99,
+        "hist_counts": signed_counts,
+        "hist_edges": np.linspace(-1.0, 1.0, SIGNED_BINS + 1),
+        "display": display,
+        "display_step": step,
+    }
 
 
 def main():
@@ -148,87 +314,128 @@ def main():
     parser.add_argument(
         "--seed", type=int, default=42, help="Random seed for local sampling"
     )
+    parser.add_argument(
+        "--dpi", type=int, default=100, help="Report image resolution"
+    )
+    parser.add_argument(
+        "--corr-gpu", action="store_true",
+        help="Compute correlation tiles on GPU via cupy (set CUPY_TF32=1 for tensor cores)"
+    )
+    parser.add_argument(
+        "--attractor-cache", default=None, metavar="PATH",
+        help="Feather file of evolved attractors reused across runs (requires pyarrow)"
+    )
+    parser.add_argument(
+        "--no-plot", action="store_true", help="Skip the visual report (stats only)"
+    )
     args = parser.parse_args()
 
     use_gpu = args.gpu and gpu_available()
     if args.gpu and not gpu_available():
         print("Warning: --gpu requested but GPU not available, falling back to CPU")
+    use_corr_gpu = args.corr_gpu and _cupy_available()
+    if args.corr_gpu and not use_corr_gpu:
+        print("Warning: --corr-gpu requested but cupy/GPU not available, using CPU BLAS")
+
+    # Opened before fetching so a missing pyarrow fails fast
+    cache = None
+    if args.attractor_cache:
+        cache = AttractorCache(args.attractor_cache, backend="gpu" if use_gpu else "cpu")
 
     n = args.n
 
     # ── Phase 1: Fetch ────────────────────────────────────────────────
-    fetch_start = time.time()
+    fetch_start = time.perf_counter_ns()
     if args.local:
         math_texts = fetch_math_samples_local(n=n, seed=args.seed)
     else:
         math_texts = fetch_math_samples(n=n, offset=args.offset)
-    fetch_time = time.time() - fetch_start
+    fetch_time = (time.perf_counter_ns() - fetch_start) / 1e9
     if len(math_texts) < n:
         print(f"Warning: only got {len(math_texts)} samples (requested {n})")
     n = len(math_texts)
 
     # ── Phase 2: Evolve through CA ────────────────────────────────────
-    attractors = []
-    states = []
-    ticks_list = []
-    labels = []
+    attractors = np.empty((n, 4096), dtype=np.float32)
+    grid = attractors.reshape(n, 64, 64)  # view for whole-frame writes
+    states = [None] * n
+    ticks_list = [0] * n
+    labels = [text[:60].replace("\n", " ") for text in math_texts]
+
+    # Attractors from earlier runs fill their rows; only the rest evolve
+    pending = list(range(n))
+    if cache is not None:
+        pending = cache.fill(math_texts, grid, states, ticks_list)
+        print(f"Loaded {n - len(pending)} cached attractors from {cache.path}")
+    m = len(pending)
 
     backend = "GPU" if use_gpu else "CPU"
-    print(f"Evolving {n} inputs through Wheeler CA ({backend})...")
-    evolve_start = time.time()
+    print(f"Evolving {m} inputs through Wheeler CA ({backend})...")
+    evolve_start = time.perf_counter_ns()
 
-    if use_gpu:
+    if use_gpu and m:
         # Batch GPU evolution
-        frames = [hash_to_frame(t) for t in math_texts]
+        frames = [hash_to_frame(math_texts[i]) for i in pending]
         print(f"  Hashed {len(frames)} frames, launching GPU batch...")
-        results = gpu_evolve_batch(frames)
-        for i, result in enumerate(results):
-            attractors.append(result["attractor"].flatten())
-            states.append(result["state"])
-            ticks_list.append(result["convergence_ticks"])
-            labels.append(math_texts[i][:60].replace("\n", " "))
-        evolve_time = time.time() - evolve_start
-        print(f"  GPU batch done in {evolve_time:.2f}s ({n / evolve_time:.0f} samples/s)")
+        if m == n:
+            # Attractors land directly in the preallocated matrix
+            _, new_states, new_ticks = gpu_evolve_batch_arrays(frames, out=grid)
+        else:
+            new_atts, new_states, new_ticks = gpu_evolve_batch_arrays(frames)
+            grid[pending] = new_atts
+        for i, state, tick in zip(pending, new_states, new_ticks):
+            states[i] = state
+            ticks_list[i] = int(tick)
+        evolve_time = (time.perf_counter_ns() - evolve_start) / 1e9
+        print(f"  GPU batch done in {evolve_time:.2f}s ({m / evolve_time:.0f} samples/s)")
     else:
         # Sequential CPU evolution
-        for i, text in enumerate(math_texts):
-            frame = hash_to_frame(text)
+        for k, i in enumerate(pending):
+            frame = hash_to_frame(math_texts[i])
             result = evolve_and_interpret(frame)
 
-            attractors.append(result["attractor"].flatten())
-            states.append(result["state"])
-            ticks_list.append(result["convergence_ticks"])
-            labels.append(text[:60].replace("\n", " "))
+            attractors[i] = result["attractor"].ravel()
+            states[i] = result["state"]
+            ticks_list[i] = result["convergence_ticks"]
 
-            if (i + 1) % 1000 == 0 or i == n - 1:
-                elapsed = time.time() - evolve_start
-                rate = (i + 1) / elapsed
-                eta = (n - i - 1) / rate if rate > 0 else 0
+            if (k + 1) % 1000 == 0 or k == m - 1:
+                elapsed = (time.perf_counter_ns() - evolve_start) / 1e9
+                rate = (k + 1) / elapsed
+                eta = (m - k - 1) / rate if rate > 0 else 0
                 print(
-                    f"  [{i + 1:>6}/{n}]  {elapsed:>6.1f}s elapsed  "
+                    f"  [{k + 1:>6}/{m}]  {elapsed:>6.1f}s elapsed  "
                     f"{rate:>7.0f} samples/s  ETA {eta:.0f}s"
                 )
-        evolve_time = time.time() - evolve_start
+        evolve_time = (time.perf_counter_ns() - evolve_start) / 1e9
 
-    # ── Phase 3: Correlation matrix (vectorised) ──────────────────────
-    print(f"\nComputing {n}×{n} correlation matrix...")
-    corr_start = time.time()
-    corr_matrix = vectorised_corrmatrix(attractors)
-    corr_time = time.time() - corr_start
+    if cache is not None and pending:
+        cache.add(
+            [math_texts[i] for i in pending], grid[pending],
+            [states[i] for i in pending], [ticks_list[i] for i in pending],
+        )
+        cache.save()
+        print(f"  Saved {len(cache)} attractors to {cache.path}")
+
+    # ── Phase 3: Correlation stats (tiled, upper triangle only) ───────
+    corr_backend = "GPU" if use_corr_gpu else "CPU"
+    print(f"\nComputing {n}×{n} correlations in {CORR_BLOCK}-row tiles ({corr_backend})...")
+    corr_start = time.perf_counter_ns()
+    corr = tiled_corr_stats(attractors, gpu=use_corr_gpu)
+    corr_time = (time.perf_counter_ns() - corr_start) / 1e9
     print(f"  Done in {corr_time:.1f}s")
 
-    # Stats (upper triangle only, exclude diagonal)
-    off_diag = corr_matrix[np.triu_indices(n, k=1)]
-    avg_corr = float(np.mean(np.abs(off_diag)))
-    max_corr = float(np.max(np.abs(off_diag)))
-    min_corr = float(np.min(np.abs(off_diag)))
-    median_corr = float(np.median(np.abs(off_diag)))
-    p95_corr = float(np.percentile(np.abs(off_diag), 95))
-    p99_corr = float(np.percentile(np.abs(off_diag), 99))
-
-    n_converged = states.count("CONVERGED")
-    n_oscillating = states.count("OSCILLATING")
-    n_chaotic = states.count("CHAOTIC")
+    n_pairs = corr["n_pairs"]
+    avg_corr = corr["avg"]
+    max_corr = corr["max"]
+    min_corr = corr["min"]
+    median_corr = corr["median"]
+    p95_corr = corr["p95"]
+    p99_corr = corr["p99"]
+
+    counts = Counter(states)
+    n_converged = counts["CONVERGED"]
+    n_oscillating = counts["OSCILLATING"]
+    n_chaotic = counts["CHAOTIC"]
     total_time = fetch_time + evolve_time + corr_time
 
     print(f"\n{'=' * 65}")
@@ -237,7 +444,7 @@ def main():
     print(f"  Source:        openbmb/UltraData-Math L3-QA-Synthetic")
     print(f"  Samples:       {n:,}")
     print(f"  Fetch time:    {fetch_time:.1f}s")
-    print(f"  Evolve time:   {evolve_time:.1f}s  ({n / evolve_time:.0f} samples/s)")
+    print(f"  Evolve time:   {evolve_time:.1f}s  ({m / max(evolve_time, 1e-9):.0f} samples/s, {n - m} cached)")
     print(f"  Corr time:     {corr_time:.1f}s")
     print(f"  Total time:    {total_time:.1f}s")
     print(f"  ─────────────────────────────────")
@@ -252,7 +459,7 @@ def main():
     print(f"  P99 |r|:       {p99_corr:.6f}")
     print(f"  Max |r|:       {max_corr:.6f}")
     print(f"  Min |r|:       {min_corr:.6f}")
-    print(f"  Pairs:         {len(off_diag):,}")
+    print(f"  Pairs:         {n_pairs:,}")
 
     pass_avg = avg_corr < 0.5
     pass_max = max_corr < 0.85
@@ -262,31 +469,52 @@ def main():
     print(f"  Overall:       {'PASS ✓' if overall else 'FAIL ✗'}")
     print(f"{'=' * 65}\n")
 
+    if args.no_plot:
+        return
+
     # ── Phase 4: Visual report ────────────────────────────────────────
+    # Imported here so --help and --no-plot runs skip matplotlib's startup cost
+    import matplotlib
+
+    matplotlib.use("Agg")  # reports are only saved to file; skip GUI backends
+
+    import matplotlib.colors as mcolors
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Patch
+
+    # Discrete 3-color map for cell roles: min=-1 (blue), slope=0 (gray), max=+1 (red)
+    role_cmap = mcolors.ListedColormap(["#3B82F6", "#9CA3AF", "#EF4444"])
+    role_norm = mcolors.BoundaryNorm([-1.5, -0.5, 0.5, 1.5], role_cmap.N)
+
     fig = plt.figure(figsize=(18, 14))
 
     # Correlation matrix (downsampled for display if n > 200)
     ax1 = fig.add_subplot(3, 2, 1)
-    if n > 200:
-        # Downsample for visual clarity
-        step = n // 200
-        display_corr = corr_matrix[::step, ::step]
+    step = corr["display_step"]
+    if step > 1:
+        # Downsampled for visual clarity
         ax1.set_title(f"Correlation Matrix (every {step}th sample)")
     else:
-        display_corr = corr_matrix
         ax1.set_title("Attractor Correlation Matrix")
-    im = ax1.imshow(display_corr, cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
+    im = ax1.imshow(corr["display"], cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
     ax1.set_xlabel("Memory Index")
     ax1.set_ylabel("Memory Index")
     fig.colorbar(im, ax=ax1, shrink=0.8)
 
     # Histogram
     ax2 = fig.add_subplot(3, 2, 2)
-    ax2.hist(off_diag, bins=100, edgecolor="none", alpha=0.8, color="#3B82F6")
+    # Trim the fixed-width histogram to its occupied range
+    counts, edges = corr["hist_counts"], corr["hist_edges"]
+    occupied = np.flatnonzero(counts)
+    lo_bin, hi_bin = occupied[0], occupied[-1] + 1
+    ax2.stairs(
+        counts[lo_bin:hi_bin], edges[lo_bin:hi_bin + 1],
+        fill=True, alpha=0.8, color="#3B82F6",
+    )
     ax2.axvline(0.85, color="red", linestyle="--", linewidth=1.5, label="Max threshold (0.85)")
     ax2.axvline(-0.85, color="red", linestyle="--", linewidth=1.5)
     ax2.axvline(avg_corr, color="orange", linestyle="--", label=f"Avg |r| = {avg_corr:.4f}")
-    ax2.set_title(f"Correlation Distribution ({len(off_diag):,} pairs)")
+    ax2.set_title(f"Correlation Distribution ({n_pairs:,} pairs)")
     ax2.set_xlim(-1, 1)
     ax2.set_xlabel("Pearson Correlation")
     ax2.set_ylabel("Count")
@@ -301,11 +529,15 @@ def main():
     else:
         show_indices = converged_indices[:8]
 
+    # Classify all shown attractors in one batched call
+    shown_roles = get_cell_roles(
+        attractors[show_indices].reshape(-1, 64, 64)
+    ) if show_indices else []
+
     for plot_idx, data_idx in enumerate(show_indices):
         ax = fig.add_subplot(3, 8, 9 + plot_idx)
-        att = np.array(attractors[data_idx]).reshape(64, 64)
-        roles = get_cell_roles(att)
-        ax.imshow(roles, cmap=ROLE_CMAP, norm=ROLE_NORM, interpolation="nearest")
+        roles = shown_roles[plot_idx]
+        ax.imshow(roles, cmap=role_cmap, norm=role_norm, interpolation="nearest")
         label = labels[data_idx][:18]
         ax.set_title(f"#{data_idx}", fontsize=7)
         ax.axis("off")
@@ -335,7 +567,7 @@ def main():
         f"Config:      L3-QA-Synthetic\n"
         f"Samples:     {n:,}\n"
         f"Offset:      {args.offset:,}\n"
-        f"Pairs:       {len(off_diag):,}\n"
+        f"Pairs:       {n_pairs:,}\n"
         f"\n"
         f"Avg |r|:     {avg_corr:.6f}\n"
         f"Median |r|:  {median_corr:.6f}\n"
@@ -356,7 +588,6 @@ def main():
     )
 
     # Role legend
-    from matplotlib.patches import Patch
     legend_elements = [
         Patch(facecolor="#EF4444", edgecolor="black", label="Local Max (+1)"),
         Patch(facecolor="#9CA3AF", edgecolor="black", label="Slope (0)"),
@@ -375,7 +606,8 @@ def main():
         fontsize=13, fontweight="bold",
     )
     plt.tight_layout(rect=[0, 0.03, 1, 0.94])
-    plt.savefig(args.output, dpi=150)
+    plt.savefig(args.output, dpi=args.dpi)
+    plt.close(fig)
     print(f"Saved visual report to {args.output}")
 
 
@@ -15,7 +15,21 @@ import matplotlib.pyplot as plt
 from datasets import load_dataset
 
 from wheeler_memory import hash_to_frame, evolve_and_interpret
-from wheeler_memory import gpu_available, gpu_evolve_batch
+from wheeler_memory import gpu_available, gpu_evolve_batch_arrays
+
+from scripts.attractor_cache import AttractorCache
+
+
+def pearson_rows(A, B):
+    """Row-wise Pearson r between two (P, D) arrays, in one vectorised pass.
+
+    Rows with zero variance get r = 0.
+    """
+    A = A - A.mean(axis=1, keepdims=True)
+    B = B - B.mean(axis=1, keepdims=True)
+    num = np.einsum("ij,ij->i", A, B)
+    den = np.sqrt(np.einsum("ij,ij->i", A, A) * np.einsum("ij,ij->i", B, B))
+    return num / np.where(den == 0, 1, den)
 
 
 def main():
@@ -31,11 +45,18 @@ def main():
     parser.add_argument(
         "--gpu", action="store_true", help="Use GPU batch evolution"
     )
+    parser.add_argument(
+        "--attractor-cache", default=None, metavar="PATH",
+        help="Feather file of evolved attractors reused across runs (requires pyarrow)"
+    )
     args = parser.parse_args()
 
     use_gpu = args.gpu and gpu_available()
     if args.gpu and not gpu_available():
         print("Warning: --gpu requested but unavailable, falling back to CPU")
+    cache = None
+    if args.attractor_cache:
+        cache = AttractorCache(args.attractor_cache, backend="gpu" if use_gpu else "cpu")
 
     # ── Phase 1: Load dataset ─────────────────────────────────────────
     print("Loading GLUE QQP dataset...")
@@ -70,67 +91,70 @@ def main():
     all_texts = list(all_texts)
     print(f"\n  Unique questions: {len(all_texts):,}")
 
+    # Attractor rows indexed by question; the dict is only used to turn
+    # pairs into index arrays once
+    text_to_idx = {text: i for i, text in enumerate(all_texts)}
+    attractors = np.empty((len(all_texts), 4096), dtype=np.float32)
+    grid = attractors.reshape(-1, 64, 64)  # view for whole-frame writes
+    states = [None] * len(all_texts)
+    ticks = [0] * len(all_texts)
+
+    # Attractors from earlier runs fill their rows; only the rest evolve
+    pending = list(range(len(all_texts)))
+    if cache is not None:
+        pending = cache.fill(all_texts, grid, states, ticks)
+        print(f"  Loaded {len(all_texts) - len(pending):,} cached attractors from {cache.path}")
+
     backend = "GPU" if use_gpu else "CPU"
-    print(f"  Evolving through Wheeler CA ({backend})...")
+    print(f"  Evolving {len(pending):,} questions through Wheeler CA ({backend})...")
     t0 = time.time()
 
-    # Build attractor lookup
-    attractor_map = {}
-
-    if use_gpu:
-        frames = [hash_to_frame(t) for t in all_texts]
-        results = gpu_evolve_batch(frames)
-        for text, result in zip(all_texts, results):
-            attractor_map[text] = result["attractor"].flatten()
+    if use_gpu and pending:
+        frames = [hash_to_frame(all_texts[i]) for i in pending]
+        new_atts, new_states, new_ticks = gpu_evolve_batch_arrays(frames)
+        grid[pending] = new_atts
+        for i, state, tick in zip(pending, new_states, new_ticks):
+            states[i] = state
+            ticks[i] = int(tick)
     else:
-        for i, text in enumerate(all_texts):
-            frame = hash_to_frame(text)
+        for k, i in enumerate(pending):
+            frame = hash_to_frame(all_texts[i])
             result = evolve_and_interpret(frame)
-            attractor_map[text] = result["attractor"].flatten()
-            if (i + 1) % 1000 == 0:
+            attractors[i] = result["attractor"].ravel()
+            states[i] = result["state"]
+            ticks[i] = result["convergence_ticks"]
+            if (k + 1) % 1000 == 0:
                 elapsed = time.time() - t0
-                print(f"    [{i+1:>6}/{len(all_texts)}] {elapsed:.1f}s")
+                print(f"    [{k+1:>6}/{len(pending)}] {elapsed:.1f}s")
 
     evolve_time = time.time() - t0
-    print(f"  Done in {evolve_time:.1f}s ({len(all_texts) / evolve_time:.0f} q/s)")
+    print(f"  Done in {evolve_time:.1f}s ({len(pending) / max(evolve_time, 1e-9):.0f} q/s)")
+
+    if cache is not None and pending:
+        cache.add(
+            [all_texts[i] for i in pending], grid[pending],
+            [states[i] for i in pending], [ticks[i] for i in pending],
+        )
+        cache.save()
+        print(f"  Saved {len(cache):,} attractors to {cache.path}")
 
     # ── Phase 3: Compute pairwise correlations ────────────────────────
     print("\n  Computing pairwise correlations...")
 
-    def pearson_r(a, b):
-        a = a - a.mean()
-        b = b - b.mean()
-        norm = np.sqrt((a**2).sum() * (b**2).sum())
-        if norm == 0:
-            return 0.0
-        return float((a * b).sum() / norm)
+    def pair_corrs(idx):
+        return np.abs(pearson_rows(attractors[idx[:, 0]], attractors[idx[:, 1]]))
 
-    dup_corrs = []
-    for q1, q2 in dup_pairs:
-        r = pearson_r(attractor_map[q1], attractor_map[q2])
-        dup_corrs.append(abs(r))
+    def pair_indices(pairs):
+        return np.array([(text_to_idx[q1], text_to_idx[q2]) for q1, q2 in pairs], dtype=np.intp)
 
-    non_corrs = []
-    for q1, q2 in non_pairs:
-        r = pearson_r(attractor_map[q1], attractor_map[q2])
-        non_corrs.append(abs(r))
+    dup_corrs = pair_corrs(pair_indices(dup_pairs))
+    non_corrs = pair_corrs(pair_indices(non_pairs))
 
     # Also compute random pairs for baseline
     rng = np.random.default_rng(42)
     rand_indices = rng.choice(len(all_texts), size=(args.n, 2), replace=True)
-    rand_corrs = []
-    for i, j in rand_indices:
-        if i == j:
-            continue
-        r = pearson_r(
-            attractor_map[all_texts[i]],
-            attractor_map[all_texts[j]],
-        )
-        rand_corrs.append(abs(r))
-
-    dup_corrs = np.array(dup_corrs)
-    non_corrs = np.array(non_corrs)
-    rand_corrs = np.array(rand_corrs)
+    rand_indices = rand_indices[rand_indices[:, 0] != rand_indices[:, 1]]
+    rand_corrs = pair_corrs(rand_indices)
 
     # ── Phase 4: Report ───────────────────────────────────────────────
     print(f"\n{'='*65}")
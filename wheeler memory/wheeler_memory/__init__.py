@@ -9,7 +9,7 @@ from .chunking import (
     select_chunk,
     select_recall_chunks,
 )
-from .dynamics import apply_ca_dynamics, evolve_and_interpret
+from .dynamics import apply_ca_dynamics, evolve_and_interpret, evolve_and_interpret_batch
 from .hashing import hash_to_frame, text_to_hex
 from .oscillation import detect_oscillation, get_cell_roles
 from .rotation import store_with_rotation_retry
@@ -25,11 +25,17 @@ from .temperature import (
 
 # GPU backend (optional — available only when libwheeler_ca.so is built)
 try:
-    from .gpu_dynamics import gpu_available, gpu_evolve_batch, gpu_evolve_single
+    from .gpu_dynamics import (
+        gpu_available,
+        gpu_evolve_batch,
+        gpu_evolve_batch_arrays,
+        gpu_evolve_single,
+    )
 except ImportError:
     gpu_available = lambda: False
     gpu_evolve_single = None
     gpu_evolve_batch = None
+    gpu_evolve_batch_arrays = None
 
 # Embedding backend (optional — requires sentence-transformers)
 try:
@@ -47,6 +53,7 @@ __all__ = [
     "text_to_hex",
     "apply_ca_dynamics",
     "evolve_and_interpret",
+    "evolve_and_interpret_batch",
     "get_cell_roles",
     "detect_oscillation",
     "MemoryBrick",
@@ -70,6 +77,7 @@ __all__ = [
     "gpu_available",
     "gpu_evolve_single",
     "gpu_evolve_batch",
+    "gpu_evolve_batch_arrays",
     # Embedding (optional)
     "embed_available",
     "embed_to_frame",
@@ -4,6 +4,8 @@ Implements the 3-state CA dynamics: local max cells push toward +1,
 local min cells push toward -1, slope cells flow toward their max neighbor.
 """
 
+from collections import deque
+
 import numpy as np
 
 from .oscillation import detect_oscillation
@@ -16,11 +18,14 @@ def apply_ca_dynamics(frame: np.ndarray) -> np.ndarray:
       - Local max (>= all 4 neighbors): delta = (1 - cell) * 0.35
       - Local min (<= all 4 neighbors): delta = (-1 - cell) * 0.35
       - Slope (neither): delta = (max_neighbor - cell) * 0.20
+
+    Accepts a single frame or a stack of frames (..., H, W); each frame
+    in a stack is updated independently.
     """
-    n_up = np.roll(frame, 1, axis=0)
-    n_down = np.roll(frame, -1, axis=0)
-    n_left = np.roll(frame, 1, axis=1)
-    n_right = np.roll(frame, -1, axis=1)
+    n_up = np.roll(frame, 1, axis=-2)
+    n_down = np.roll(frame, -1, axis=-2)
+    n_left = np.roll(frame, 1, axis=-1)
+    n_right = np.roll(frame, -1, axis=-1)
 
     is_max = (frame >= n_up) & (frame >= n_down) & (frame >= n_left) & (frame >= n_right)
     is_min = (frame <= n_up) & (frame <= n_down) & (frame <= n_left) & (frame <= n_right)
@@ -45,6 +50,8 @@ def evolve_and_interpret(frame: np.ndarray, max_iters: int = 1000) -> dict:
       - convergence_ticks: number of iterations
       - history: list of all frame copies (for brick construction)
       - metadata: additional info (cycle_period, etc.)
+
+    The input frame is not modified, so callers need not copy it.
     """
     stability_threshold = 1e-4
     history = [frame.copy()]
@@ -87,3 +94,96 @@ def evolve_and_interpret(frame: np.ndarray, max_iters: int = 1000) -> dict:
         "history": history,
         "metadata": {},
     }
+
+
+# Frames advanced together per lockstep group; small enough that the
+# working set of one CA tick stays cache-resident.
+_BATCH_CHUNK = 16
+
+
+def evolve_and_interpret_batch(frames, max_iters: int = 1000) -> list[dict]:
+    """Evolve a batch of frames on CPU, advancing them in lockstep.
+
+    Each tick applies apply_ca_dynamics to a whole group of still-active
+    frames in one vectorised call; frames drop out of the group as they
+    converge or oscillate. Per-frame outcomes match evolve_and_interpret.
+
+    Args:
+        frames: list of N 64×64 numpy arrays, or an (N, 64, 64) array
+        max_iters: max CA iterations
+
+    Returns:
+        list of N result dicts (same format as evolve_and_interpret,
+        but without history, like gpu_evolve_batch)
+    """
+    results = []
+    for start in range(0, len(frames), _BATCH_CHUNK):
+        results.extend(_evolve_lockstep(frames[start : start + _BATCH_CHUNK], max_iters))
+    return results
+
+
+def _evolve_lockstep(frames, max_iters: int) -> list[dict]:
+    """Run one group of frames through evolve_and_interpret's loop together."""
+    stability_threshold = 1e-4
+    window = 20  # detect_oscillation's default window
+
+    batch = np.array(frames)
+    results: list[dict | None] = [None] * len(batch)
+    active = np.arange(len(batch))
+    # Recent frames of the active set, only kept once oscillation checks
+    # can need them (ticks > 50 look back `window` frames)
+    recent: deque[np.ndarray] = deque(maxlen=window)
+
+    for i in range(max_iters):
+        if len(active) == 0:
+            break
+        batch_old = batch
+        batch = apply_ca_dynamics(batch)
+        delta = np.abs(batch - batch_old).mean(axis=(-2, -1))
+
+        if i >= 50 - window:
+            recent.append(batch)
+
+        done = delta < stability_threshold
+        for j in np.flatnonzero(done):
+            results[active[j]] = {
+                "state": "CONVERGED",
+                "attractor": batch[j].copy(),
+                "convergence_ticks": i + 1,
+                "history": [],
+                "metadata": {},
+            }
+
+        if i > 50 and i % 10 == 0:
+            for j in np.flatnonzero(~done):
+                osc_result = detect_oscillation([f[j] for f in recent], window)
+                if osc_result["oscillating"]:
+                    done[j] = True
+                    results[active[j]] = {
+                        "state": "OSCILLATING",
+                        "attractor": batch[j].copy(),
+                        "convergence_ticks": i + 1,
+                        "history": [],
+                        "metadata": {
+                            "cycle_period": osc_result["period"],
+                            "oscillating_cells": osc_result["oscillating_cells"],
+                            "cycle_states": osc_result["cycle_states"],
+                        },
+                    }
+
+        if done.any():
+            keep = ~done
+            active = active[keep]
+            batch = batch[keep]
+            recent = deque((f[keep] for f in recent), maxlen=window)
+
+    for j, idx in enumerate(active):
+        results[idx] = {
+            "state": "CHAOTIC",
+            "attractor": batch[j],
+            "convergence_ticks": max_iters,
+            "history": [],
+            "metadata": {},
+        }
+
+    return results
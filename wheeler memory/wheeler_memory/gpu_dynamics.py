@@ -5,8 +5,10 @@ matching the CPU evolve_and_interpret API.  Falls back gracefully
 when the GPU library is not available.
 """
 
+import atexit
 import ctypes
 import os
+import threading
 import numpy as np
 
 from .dynamics import apply_ca_dynamics  # CPU fallback for get_cell_roles
@@ -17,6 +19,14 @@ _LIB_PATH = os.path.join(_LIB_DIR, _LIB_NAME)
 
 _lib = None
 
+# Reusable pinned (page-locked) host staging for gpu_evolve_batch, grown on
+# demand up to PINNED_MAX_FRAMES.  Holds input frames followed by output
+# frames; larger batches are streamed through it in chunks.
+PINNED_MAX_FRAMES = 1024  # 2 × 1024 × 16 KB = 32 MB of page-locked memory
+_pinned_lock = threading.Lock()
+_pinned_ptr = None
+_pinned_floats = 0
+
 
 def _load_lib():
     """Try to load the HIP shared library."""
@@ -49,12 +59,52 @@ def _load_lib():
         ]
         _lib.ca_evolve_single.restype = ctypes.c_int
 
+        # Pinned host allocation (absent from libraries built before it
+        # was added; gpu_evolve_batch then stages through pageable memory)
+        if hasattr(_lib, "ca_host_alloc"):
+            _lib.ca_host_alloc.argtypes = [ctypes.c_size_t]
+            _lib.ca_host_alloc.restype = ctypes.c_void_p
+            _lib.ca_host_free.argtypes = [ctypes.c_void_p]
+            _lib.ca_host_free.restype = None
+
         return _lib
     except OSError as e:
         print(f"Warning: could not load GPU library: {e}")
         return None
 
 
+def _pinned_staging(lib, n_floats: int) -> np.ndarray | None:
+    """Return a float32 view of at least n_floats of pinned host memory.
+
+    The buffer is reused across calls and only reallocated when a larger
+    batch arrives. Returns None if pinned allocation is unavailable.
+    Callers must hold _pinned_lock while using the view.
+    """
+    global _pinned_ptr, _pinned_floats
+    if not hasattr(lib, "ca_host_alloc"):
+        return None
+    if n_floats > _pinned_floats:
+        if _pinned_ptr is not None:
+            lib.ca_host_free(_pinned_ptr)
+            _pinned_ptr, _pinned_floats = None, 0
+        ptr = lib.ca_host_alloc(n_floats * 4)
+        if not ptr:
+            return None
+        _pinned_ptr, _pinned_floats = ptr, n_floats
+    buf = ctypes.cast(_pinned_ptr, ctypes.POINTER(ctypes.c_float))
+    return np.ctypeslib.as_array(buf, shape=(n_floats,))
+
+
+@atexit.register
+def _free_pinned_staging():
+    """Release the pinned staging buffer at interpreter exit."""
+    global _pinned_ptr, _pinned_floats
+    with _pinned_lock:
+        if _pinned_ptr is not None and _lib is not None:
+            _lib.ca_host_free(_pinned_ptr)
+        _pinned_ptr, _pinned_floats = None, 0
+
+
 def gpu_available() -> bool:
     """Check if the GPU backend is ready."""
     return _load_lib() is not None
@@ -97,55 +147,107 @@ def gpu_evolve_single(frame: np.ndarray, max_iters: int = 1000) -> dict:
     }
 
 
-def gpu_evolve_batch(frames: list[np.ndarray], max_iters: int = 1000) -> list[dict]:
-    """Evolve a batch of frames on GPU in parallel.
+def gpu_evolve_batch_arrays(
+    frames: list[np.ndarray] | np.ndarray,
+    max_iters: int = 1000,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, list[str], np.ndarray]:
+    """Evolve a batch of frames on GPU, returning columnar results.
+
+    Same computation as gpu_evolve_batch, but without building a dict
+    and copying an attractor per frame: all attractors come back in one
+    contiguous array.
 
     Args:
-        frames: list of N 64×64 numpy arrays
+        frames: list of N 64×64 numpy arrays, or an (N, 64, 64) array;
+            not modified
         max_iters: max CA iterations
+        out: optional C-contiguous float32 array of shape (N, 64, 64) to
+            write the attractors into (e.g. a view of a caller's
+            preallocated matrix); allocated if omitted
 
     Returns:
-        list of N result dicts (same format as evolve_and_interpret,
-        but without history)
+        (attractors, states, ticks): an (N, 64, 64) float32 array, a list
+        of N state names, and an int32 array of N convergence ticks
     """
     lib = _load_lib()
     if lib is None:
         raise RuntimeError("GPU library not available. Build with: cd wheeler_memory/gpu && make")
 
     batch_size = len(frames)
+    if out is None:
+        out = np.empty((batch_size, 64, 64), dtype=np.float32)
+    elif (out.shape != (batch_size, 64, 64) or out.dtype != np.float32
+          or not out.flags.c_contiguous):
+        raise ValueError(f"out must be a C-contiguous float32 array of shape ({batch_size}, 64, 64)")
     if batch_size == 0:
-        return []
+        return out, [], np.zeros(0, dtype=np.int32)
 
-    # Pack all frames into a contiguous float32 buffer
-    flat_in = np.zeros(batch_size * 64 * 64, dtype=np.float32)
-    for i, f in enumerate(frames):
-        flat_in[i * 4096 : (i + 1) * 4096] = f.flatten().astype(np.float32)
-
-    flat_out = np.zeros_like(flat_in)
+    n_floats = batch_size * 4096
     ticks_out = np.zeros(batch_size, dtype=np.int32)
     states_out = np.zeros(batch_size, dtype=np.int32)
+    state_names = {0: "CONVERGED", 1: "OSCILLATING", 2: "CHAOTIC"}
 
-    ret = lib.ca_evolve_batch(
-        flat_in.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-        flat_out.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-        ticks_out.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
-        states_out.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
-        batch_size,
-        max_iters,
-    )
-    if ret != 0:
-        raise RuntimeError("GPU kernel execution failed")
+    def run(flat_in, flat_out, start, count):
+        ret = lib.ca_evolve_batch(
+            flat_in.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            flat_out.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            ticks_out[start:].ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+            states_out[start:].ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+            count,
+            max_iters,
+        )
+        if ret != 0:
+            raise RuntimeError("GPU kernel execution failed")
+
+    with _pinned_lock:
+        chunk = min(batch_size, PINNED_MAX_FRAMES)
+        chunk_floats = chunk * 4096
+        staging = _pinned_staging(lib, 2 * chunk_floats)
+        if staging is not None:
+            # Stream through the capped pinned buffer so the H2D/D2H copies
+            # DMA directly, one kernel launch per chunk
+            flat_in = staging[:chunk_floats]
+            flat_out = staging[chunk_floats : 2 * chunk_floats]
+            for start in range(0, batch_size, chunk):
+                count = min(chunk, batch_size - start)
+                n = count * 4096
+                flat_in[:n].reshape(count, 64, 64)[:] = frames[start:start + count]
+                run(flat_in, flat_out, start, count)
+                # Bulk copy out before the staging buffer is reused
+                out[start:start + count].reshape(n)[:] = flat_out[:n]
+        else:
+            # Pack all frames into a contiguous float32 buffer (zero-copy
+            # when given a contiguous float32 (N, 64, 64) array) and let
+            # the kernel write straight into out
+            flat_in = np.ascontiguousarray(frames, dtype=np.float32).reshape(n_floats)
+            run(flat_in, out.reshape(n_floats), 0, batch_size)
+
+    states = [state_names.get(int(s), "CHAOTIC") for s in states_out]
+    return out, states, ticks_out
 
-    state_names = {0: "CONVERGED", 1: "OSCILLATING", 2: "CHAOTIC"}
 
-    results = []
-    for i in range(batch_size):
-        results.append({
-            "state": state_names.get(int(states_out[i]), "CHAOTIC"),
-            "attractor": flat_out[i * 4096 : (i + 1) * 4096].reshape(64, 64).copy(),
-            "convergence_ticks": int(ticks_out[i]),
+def gpu_evolve_batch(frames: list[np.ndarray], max_iters: int = 1000) -> list[dict]:
+    """Evolve a batch of frames on GPU in parallel.
+
+    Args:
+        frames: list of N 64×64 numpy arrays, or an (N, 64, 64) array;
+            not modified
+        max_iters: max CA iterations
+
+    Returns:
+        list of N result dicts (same format as evolve_and_interpret,
+        but without history). Each attractor is a view into one shared
+        (N, 64, 64) array; see gpu_evolve_batch_arrays for the columnar form.
+    """
+    attractors, states, ticks = gpu_evolve_batch_arrays(frames, max_iters)
+    return [
+        {
+            "state": state,
+            "attractor": attractors[i],
+            "convergence_ticks": int(ticks[i]),
             "history": [],
             "metadata": {"backend": "gpu"},
-        })
-
-    return results
+        }
+        for i, state in enumerate(states)
+    ]
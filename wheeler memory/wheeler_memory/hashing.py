@@ -1,5 +1,6 @@
 """Deterministic text-to-frame hashing using SHA-256."""
 
+import functools
 import hashlib
 import numpy as np
 
@@ -9,13 +10,25 @@ def text_to_hex(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_frame(text: str, size: int) -> np.ndarray:
+    """Build the frame for (text, size) once; stored read-only."""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    seed = int.from_bytes(digest[:8], "big")
+    rng = np.random.Generator(np.random.PCG64(seed))
+    frame = rng.uniform(-1.0, 1.0, size=(size, size)).astype(np.float32)
+    frame.flags.writeable = False
+    return frame
+
+
 def hash_to_frame(text: str, size: int = 64) -> np.ndarray:
     """Convert text to a deterministic 64x64 frame via SHA-256 seeded RNG.
 
     Uses SHA-256 hash as seed for numpy PCG64 generator, then fills
     a size x size frame with uniform(-1, 1) values.
+
+    Recently used frames are memoised, so repeated texts (benchmarks,
+    diversity runs, repeated queries) skip the hash and RNG fill. Each
+    call returns a fresh writable copy.
     """
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    seed = int.from_bytes(digest[:8], "big")
-    rng = np.random.Generator(np.random.PCG64(seed))
-    return rng.uniform(-1.0, 1.0, size=(size, size)).astype(np.float32)
+    return _cached_frame(text, size).copy()
@@ -12,11 +12,13 @@ def get_cell_roles(frame: np.ndarray) -> np.ndarray:
     """Classify each cell as +1 (local max), -1 (local min), or 0 (slope).
 
     Uses von Neumann (4-neighbor) comparison with wrapping boundaries.
+    Accepts a single frame or a stack of frames (..., H, W) and classifies
+    every frame in one vectorised pass.
     """
-    n_up = np.roll(frame, 1, axis=0)
-    n_down = np.roll(frame, -1, axis=0)
-    n_left = np.roll(frame, 1, axis=1)
-    n_right = np.roll(frame, -1, axis=1)
+    n_up = np.roll(frame, 1, axis=-2)
+    n_down = np.roll(frame, -1, axis=-2)
+    n_left = np.roll(frame, 1, axis=-1)
+    n_right = np.roll(frame, -1, axis=-1)
 
     is_max = (frame >= n_up) & (frame >= n_down) & (frame >= n_left) & (frame >= n_right)
     is_min = (frame <= n_up) & (frame <= n_down) & (frame <= n_left) & (frame <= n_right)
@@ -44,7 +46,7 @@ def detect_oscillation(history: list[np.ndarray], window: int = 20) -> dict:
         return {"oscillating": False, "period": None, "oscillating_cells": 0, "cycle_states": None}
 
     recent = history[-window:]
-    role_matrices = np.array([get_cell_roles(f) for f in recent], dtype=np.int8)
+    role_matrices = get_cell_roles(np.asarray(recent))
     total_cells = role_matrices.shape[1] * role_matrices.shape[2]
 
     # Check if any cells actually change roles